@@ -1,14 +1,75 @@
+import functools
+import io
+import os
+from dataclasses import dataclass
+
 import elsie
+from elsie.boxtree import boxmixin
 from elsie.boxtree.box import Box
+from elsie.ext import unordered_list
+from elsie.render.backends.svg.rcontext import SvgRenderingContext
+from elsie.render.render import RenderUnit
+from elsie.text.highlight import MyFormatter
+from elsie.text.textparser import normalize_tokens
+from pygments import highlight
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from PyPDF2 import PdfFileMerger
+
+try:
+    import cairocffi
+    import pangocffi
+    from elsie.render.backends import CairoBackend
+except ImportError:
+    CairoBackend = None
+
+_BOLD = elsie.TextStyle(bold=True)
+_SECTION_TITLE = elsie.TextStyle(align="right", size=240, bold=True)
+_PAGE_NUMBER = elsie.TextStyle(align="right")
+_PAGE_OF_TOTAL = elsie.TextStyle(align="right", size=36)
+
+_CODE_BG = "#EAEAEA"
+_CODE_PADDING = dict(p_left=20, p_right=20, p_top=20, p_bottom=20)
+
+_LEXER_CACHE: dict[str, Lexer] = {}
+
+_SLIDES_DIR = os.path.dirname(os.path.realpath(__file__))
+_STATIC_DIR = os.path.realpath(os.path.join(_SLIDES_DIR, "..", "static"))
+_CACHE_DIR = os.path.join(_SLIDES_DIR, "elsie-cache")
 
 
 def get_static_path(filename: str):
-    static_dir = "../static/"
-    return static_dir + filename
+    return os.path.join(_STATIC_DIR, filename)
 
 
 def get_image_path(filename: str):
-    return get_static_path("images/" + filename)
+    return get_static_path(os.path.join("images", filename))
+
+
+# Deck-only images in slides/images, found regardless of the working directory
+def get_slides_image_path(filename: str):
+    return os.path.join(_SLIDES_DIR, "images", filename)
+
+
+PICKNIK_LOGO = get_image_path("picknik_logo.png")
+KART_IMG = get_image_path("kart.jpg")
+
+
+def get_lexer(language: str) -> Lexer:
+    lexer = _LEXER_CACHE.get(language)
+    if lexer is None:
+        lexer = _LEXER_CACHE[language] = get_lexer_by_name(language)
+    return lexer
+
+
+def _highlight_code(code: str, language: str):
+    formatter = MyFormatter()
+    highlight(code, get_lexer(language), formatter)
+    return normalize_tokens(formatter.stream)
+
+
+# Box.code() takes no lexer argument, so route its highlighting through the cache
+boxmixin.highlight_code = _highlight_code
 
 
 def split_lines(input: str, lines: int):
@@ -27,8 +88,53 @@ def n_empty_trailing(input: str):
     return 0
 
 
+# Render unit that only draws with Cairo when its slide's SVG is not cached yet
+class _CachedCairoRenderUnit(RenderUnit):
+    def __init__(self, slide, step, svg: str, draw: callable):
+        super().__init__(slide, step)
+        self.svg = svg
+        self.draw = draw
+
+    def export(self, fs_cache, export_type: str):
+        return fs_cache.ensure(self.svg.encode(), export_type, self._export)
+
+    def _export(self, source, target: str, export_type: str):
+        filename = self.draw(export_type).export(None, export_type)
+        os.replace(filename, target)
+
+    def get_svg(self):
+        return self.svg
+
+
+if CairoBackend is not None:
+
+    # Elsie's Inkscape backend reuses the PDF of any slide whose SVG is unchanged
+    # since the last run, but its Cairo backend redraws every slide. Key Cairo
+    # slides on the same SVG so a one slide edit only redraws that slide.
+    class CachedCairoBackend(CairoBackend):
+        # Like the Inkscape backend's key, so a library upgrade redraws every slide
+        def get_version(self, elsie_version: str) -> str:
+            cairo = cairocffi.cairo_version_string()
+            pango = pangocffi.pango_version_string()
+            return f"{elsie_version}/cairo-{cairo}/pango-{pango}"
+
+        def create_render_unit(self, slide, step: int, export_type: str):
+            ctx = SvgRenderingContext(slide, step, slide.debug_boxes)
+            painters = slide._box.get_painters(ctx, 0)
+            painters.sort(key=lambda painter: painter.z_level)
+            for p in painters:
+                p.render(ctx)
+            draw = functools.partial(super().create_render_unit, slide, step)
+            return _CachedCairoRenderUnit(slide, step, ctx.render(), draw)
+
+
 def init_deck(font="Lato"):
-    slides = elsie.SlideDeck(width=1920, height=1080)
+    # Cairo renders in-process; without elsie[cairo] fall back to Inkscape
+    backend = CachedCairoBackend(cache_dir=_CACHE_DIR) if CairoBackend else None
+    # Elsie keeps its text measurements and per-slide PDFs here between runs
+    slides = elsie.SlideDeck(
+        width=1920, height=1080, backend=backend, cache_dir=_CACHE_DIR
+    )
     slides.update_style("default", elsie.TextStyle(font=font, align="left", size=64))
     slides.update_style("code", elsie.TextStyle(size=38))
     slides.set_style("link", elsie.TextStyle(color="blue"))
@@ -42,7 +148,16 @@ def init_deck(font="Lato"):
 def page_numbering(slides: elsie.SlideDeck):
     for i, slide in enumerate(slides):
         slide.box(x="[100%]", y="[100%]", p_right=30, p_bottom=30).text(
-            f"{i}", elsie.TextStyle(align="right")
+            f"{i}", _PAGE_NUMBER
+        )
+
+
+def page_of_total_numbering(slides: elsie.SlideDeck):
+    total = len(slides)
+    labels = [f"{i} ~grayed_text{{of {total}}}" for i in range(1, total + 1)]
+    for slide, label in zip(slides, labels):
+        slide.box(x="[100%]", y="[100%]", p_right=30, p_bottom=30).text(
+            label, _PAGE_OF_TOTAL
         )
 
 
@@ -51,16 +166,40 @@ def render_deck(
     filename: str,
     page_numbering_func: callable = page_numbering,
 ):
-    slides.render(
-        get_static_path("pdf/" + filename), slide_postprocessing=page_numbering_func
+    units = slides.render(
+        None, return_units=True, slide_postprocessing=page_numbering_func
     )
+    merger = PdfFileMerger()
+    for unit in units:
+        pdf = unit.export(slides.fs_cache, "pdf")
+        if pdf is not None:
+            # PyPDF2 parses with many tiny seeks and reads, keep those in memory
+            with open(pdf, "rb") as f:
+                merger.append(io.BytesIO(f.read()))
+
+    output = get_static_path("pdf/" + filename)
+    with open(output, "wb", buffering=1 << 20) as f:
+        merger.write(f)
+    slides.fs_cache.remove_unused()
+    print(f"SlideDeck written into '{output}'")
+
+
+# Items are either text or (text, show) pairs; returns the text items
+def bullets(parent: Box, items):
+    lst = unordered_list(parent)
+    text_items = []
+    for item in items:
+        if isinstance(item, str):
+            text_items.append(lst.item().text(item))
+        else:
+            text, show = item
+            text_items.append(lst.item(show=show).text(text))
+    return text_items
 
 
 def logo_header_slide(parent: Box, title: str):
-    parent.box(x=1570, y=40).image(get_image_path("picknik_logo.png"))
-    parent.sbox(name="header", x=0, height=140).fbox(p_left=20).text(
-        title, elsie.TextStyle(bold=True)
-    )
+    parent.box(x=1570, y=40).image(PICKNIK_LOGO)
+    parent.sbox(name="header", x=0, height=140).fbox(p_left=20).text(title, _BOLD)
     return parent.fbox(name="content", p_left=20, p_right=20)
 
 
@@ -88,21 +227,40 @@ def full_image_slide(parent: Box, title: str, image_path: str):
 
 def section_title_slide(parent: Box, title: str, subtitle: str):
     content = logo_header_slide(parent, "")
-    content.sbox().text(title, elsie.TextStyle(align="right", size=240, bold=True))
+    content.sbox().text(title, _SECTION_TITLE)
     content.box().text(subtitle)
 
 
 # Returns the code object so you can do line highlighting
 def code_slide(parent: Box, title: str, language: str, code: str):
     content = logo_header_slide(parent, title)
-    code_bg = "#EAEAEA"
     box = content.box(y=0, width="100%", height="100%", p_bottom=20, z_level=-2)
-    box.rect(bg_color=code_bg, rx=20, ry=20)
-    return (
-        box.overlay()
-        .sbox(x=0, y=0, p_left=20, p_right=20, p_top=20, p_bottom=20, z_level=0)
-        .code(language, code)
-    )
+    box.rect(bg_color=_CODE_BG, rx=20, ry=20)
+    return box.overlay().sbox(x=0, y=0, z_level=0, **_CODE_PADDING).code(language, code)
+
+
+# Rounded code block for mixing code with other content on a slide
+def code_block(parent: Box, language: str, code: str, name: str = None, width=None):
+    block = parent.sbox(name=name, width="100%", z_level=-1)
+    block.rect(bg_color=_CODE_BG, rx=20, ry=20)
+    return block.box(z_level=0, width=width, **_CODE_PADDING).code(language, code)
+
+
+# One full-slide code listing for add_code_slides
+@dataclass(frozen=True, slots=True)
+class CodeSlide:
+    title: str
+    language: str
+    code: str
+
+
+def add_code_slides(slides: elsie.SlideDeck, code_slides: list[CodeSlide]):
+    for cs in code_slides:
+        code_slide(slides.new_slide(debug_boxes=False), cs.title, cs.language, cs.code)
+
+
+def add_full_image_slide(slides: elsie.SlideDeck, title: str, image_path: str):
+    full_image_slide(slides.new_slide(debug_boxes=False), title, image_path)
 
 
 def grayed_before_after_code_slide(
@@ -114,15 +272,12 @@ def grayed_before_after_code_slide(
     code_lines: int,
 ):
     content = logo_header_slide(parent, title)
-    code_bg = "#EAEAEA"
     box = content.box(y=0, width="100%", height="100%", p_bottom=20, z_level=-2)
-    box.rect(bg_color=code_bg, rx=20, ry=20)
+    box.rect(bg_color=_CODE_BG, rx=20, ry=20)
     overlay = box.overlay()
     (before, code) = split_lines(code, code_start)
     (code, after) = split_lines(code, code_lines)
-    before_box = overlay.sbox(
-        name="before", x=0, y=0, p_left=20, p_right=20, p_top=20, p_bottom=20, z_level=0
-    )
+    before_box = overlay.sbox(name="before", x=0, y=0, z_level=0, **_CODE_PADDING)
     before_box.code("", before, style="grayed")
     code_box = overlay.sbox(
         name="code", x=0, y=before_box.y("100%"), z_level=0, p_left=20, p_right=20
@@ -5,8 +5,21 @@
 # - How do we theme the presentation? Jokes? Capture / Hold attention?
 
 import elsie
-from elsie.ext import unordered_list
-from my_layouts import *
+from my_layouts import (
+    CodeSlide,
+    KART_IMG,
+    add_code_slides,
+    bullets,
+    code_slide,
+    get_slides_image_path,
+    grayed_before_after_code_slide,
+    image_slide,
+    init_deck,
+    logo_header_slide,
+    render_deck,
+    section_title_slide,
+    split_lines,
+)
 
 
 slides = init_deck()
@@ -22,18 +35,23 @@ def title(slide):
         "generate_parameter_library", elsie.TextStyle(size=36, bold=True, italic=True)
     )
     content.box(width="fill", p_top=10).text("October 20, 2023")
-    content.box(width="fill", p_top=180).text("Tyler Weaver")
-    content.box(width="fill").text("Staff Software Engineer\ntyler@picknik.ai")
+    content.box(width="fill", p_top=180).text(
+        "Tyler Weaver\nStaff Software Engineer\ntyler@picknik.ai"
+    )
 
 
 @slides.slide(debug_boxes=False)
 def author(slide):
-    text_area = image_slide(slide, "Tyler Weaver", get_image_path("kart.jpg"))
-    lst = unordered_list(text_area)
-    lst.item().text("Racing Kart Driver")
-    lst.item().text("MoveIt Maintainer")
-    lst.item().text("Rust Evangelist")
-    lst.item().text("Docker Skeptic")
+    text_area = image_slide(slide, "Tyler Weaver", KART_IMG)
+    bullets(
+        text_area,
+        [
+            "Racing Kart Driver",
+            "MoveIt Maintainer",
+            "Rust Evangelist",
+            "Docker Skeptic",
+        ],
+    )
 
 
 @slides.slide(debug_boxes=False)
@@ -41,13 +59,7 @@ def part_1(slide):
     section_title_slide(slide, "RCLCPP\nParameters", "Part 1")
 
 
-@slides.slide(debug_boxes=False)
-def innocence(slide):
-    grayed_before_after_code_slide(
-        slide,
-        "Getting Started",
-        "C++",
-        """int main(int argc, char ** argv)
+INNOCENCE_CODE = """int main(int argc, char ** argv)
 {
   rclcpp::init(argc, argv);
 
@@ -58,33 +70,22 @@ def innocence(slide):
   rclcpp::spin(node);
   rclcpp::shutdown();
 }
-""",
-        5,
-        2,
-    )
+"""
 
 
 @slides.slide(debug_boxes=False)
-def struct_with_defaults(slide):
-    code_slide(
+def innocence(slide):
+    grayed_before_after_code_slide(
         slide,
-        "Parameter Struct",
+        "Getting Started",
         "C++",
-        """struct Params {
-  std::string my_string = "world";
-  int my_number = 23;
-};
-""",
+        INNOCENCE_CODE,
+        5,
+        2,
     )
 
 
-@slides.slide(debug_boxes=False)
-def struct_with_defaults(slide):
-    grayed_before_after_code_slide(
-        slide,
-        "Parameter Struct",
-        "C++",
-        """struct Params {
+STRUCT_CODE = """struct Params {
   std::string my_string = "world";
   int my_number = 23;
 };
@@ -100,34 +101,32 @@ int main(int argc, char ** argv)
   rclcpp::spin(node);
   rclcpp::shutdown();
 }
-""",
-        9,
-        3,
-    )
+"""
 
 
 @slides.slide(debug_boxes=False)
-def details(slide):
+def struct_with_defaults(slide):
     code_slide(
         slide,
-        "ParameterDescriptor",
+        "Parameter Struct",
         "C++",
-        """  auto param_desc  = rcl_interfaces::msg::ParameterDescriptor{};
-  param_desc.description = "Mine!";
-  param_desc.additional_constraints  = "One of [world, base, home]";
-  params.my_string = node->declare_parameter("my_string",
-    params.my_string, param_desc);
-""",
+        split_lines(STRUCT_CODE, 4)[0],
     )
 
 
 @slides.slide(debug_boxes=False)
-def details(slide):
+def struct_with_defaults_usage(slide):
     grayed_before_after_code_slide(
         slide,
-        "ParameterDescriptor",
+        "Parameter Struct",
         "C++",
-        """  auto param_desc  = rcl_interfaces::msg::ParameterDescriptor{};
+        STRUCT_CODE,
+        9,
+        3,
+    )
+
+
+DETAILS_CODE = """  auto param_desc  = rcl_interfaces::msg::ParameterDescriptor{};
   param_desc.description = "Mine!";
   param_desc.additional_constraints  = "One of [world, base, home]";
   params.my_string = node->declare_parameter("my_string",
@@ -138,50 +137,32 @@ def details(slide):
   params.my_number = node->declare_parameter("my_number",
     params.my_number, param_desc);
   // ...
-""",
-        5,
-        5,
-    )
+"""
 
 
 @slides.slide(debug_boxes=False)
-def validate(slide):
+def details(slide):
     code_slide(
         slide,
-        "Validation",
+        "ParameterDescriptor",
         "C++",
-        """auto const _ = node->add_on_set_parameters_callback(
-  [](std::vector<rclcpp::Parameter> const& params)
-  -> rcl_interfaces::msg::SetParametersResult {
-""",
+        split_lines(DETAILS_CODE, 5)[0],
     )
 
 
 @slides.slide(debug_boxes=False)
-def validate(slide):
+def details_both(slide):
     grayed_before_after_code_slide(
         slide,
-        "Validation",
+        "ParameterDescriptor",
         "C++",
-        """auto const _ = node->add_on_set_parameters_callback(
-  [](std::vector<rclcpp::Parameter> const& params)
-  -> rcl_interfaces::msg::SetParametersResult {
-    for (auto const& param : params) {
-      if(param.get_name() == "my_string") {
-          auto const value = param.get_value<std::string>();
-""",
-        3,
-        3,
+        DETAILS_CODE,
+        5,
+        5,
     )
 
 
-@slides.slide(debug_boxes=False)
-def validate(slide):
-    grayed_before_after_code_slide(
-        slide,
-        "Validation",
-        "C++",
-        """auto const _ = node->add_on_set_parameters_callback(
+VALIDATE_CODE = """auto const _ = node->add_on_set_parameters_callback(
   [](std::vector<rclcpp::Parameter> const& params)
   -> rcl_interfaces::msg::SetParametersResult {
     for (auto const& param : params) {
@@ -196,7 +177,38 @@ def validate(slide):
               .append("} not one of: [world, base, home]");
             return result;
           }
-""",
+"""
+
+
+@slides.slide(debug_boxes=False)
+def validate(slide):
+    code_slide(
+        slide,
+        "Validation",
+        "C++",
+        split_lines(VALIDATE_CODE, 3)[0],
+    )
+
+
+@slides.slide(debug_boxes=False)
+def validate_loop(slide):
+    grayed_before_after_code_slide(
+        slide,
+        "Validation",
+        "C++",
+        split_lines(VALIDATE_CODE, 6)[0],
+        3,
+        3,
+    )
+
+
+@slides.slide(debug_boxes=False)
+def validate_one_of(slide):
+    grayed_before_after_code_slide(
+        slide,
+        "Validation",
+        "C++",
+        VALIDATE_CODE,
         5,
         10,
     )
@@ -205,14 +217,18 @@ def validate(slide):
 @slides.slide(debug_boxes=False)
 def copy_pasta(slide):
     content = logo_header_slide(slide, "Copy Pasta")
-    lst = unordered_list(content.box())
-    lst.item().text("parameter name: 6 separate copies")
-    lst.item().text("declaration: re-init description for each parameter")
-    lst.item().text("validation: convert vector to map")
+    bullets(
+        content.box(),
+        [
+            "parameter name: 6 separate copies",
+            "declaration: re-init description for each parameter",
+            "validation: convert vector to map",
+        ],
+    )
 
 
 @slides.slide(debug_boxes=False)
-def validate(slide):
+def boilerplate(slide):
     content = logo_header_slide(slide, "")
     content.box().text("30 lines of C++ boilerplate per parameter")
     content.box(show="2").text(
@@ -223,17 +239,11 @@ def validate(slide):
 @slides.slide(debug_boxes=False)
 def part2(slide):
     section_title_slide(slide, "generate_\nparameter_library", "Part 2")
-    slide.box(x=60, y=60).image("images/paul.jpeg", scale=1.0)
+    slide.box(x=60, y=60).image(get_slides_image_path("paul.jpeg"), scale=1.0)
     slide.box(x=50, y=530).text("Paul Gesel @pac48")
 
 
-@slides.slide(debug_boxes=False)
-def gpl(slide):
-    code_slide(
-        slide,
-        "YAML",
-        "toml",  # I know this is yaml, parser doesn't like it though
-        """
+YAML_CODE = """
 minimal_param_node:
     my_string: {
         type: string,
@@ -249,7 +259,16 @@ minimal_param_node:
             multiple_of_23: []
         }
     }
-""",
+"""
+
+
+@slides.slide(debug_boxes=False)
+def yaml(slide):
+    code_slide(
+        slide,
+        "YAML",
+        "toml",  # I know this is yaml, parser doesn't like it though
+        YAML_CODE,
     )
 
 
@@ -285,13 +304,7 @@ def error(slide):
     )
 
 
-@slides.slide(debug_boxes=False)
-def gpl(slide):
-    code_slide(
-        slide,
-        "CMake Module",
-        "cmake",
-        """
+CMAKE_CODE = """
 find_package(generate_parameter_library REQUIRED)
 
 generate_parameter_library(
@@ -304,17 +317,9 @@ target_link_libraries(minimal_node PRIVATE
   rclcpp::rclcpp
   minimal_param_node_parameters
 )
-""",
-    )
-
+"""
 
-@slides.slide(debug_boxes=False)
-def gpl(slide):
-    code_slide(
-        slide,
-        "C++ Usage",
-        "C++",
-        """
+CPP_USAGE_CODE = """
 #include <rclcpp/rclcpp.hpp>
 #include "minimal_param_node_parameters.hpp"
 
@@ -327,34 +332,47 @@ int main(int argc, char * argv[])
   auto params = param_listener->get_params();
 
   // ...
-""",
-    )
+"""
+
+add_code_slides(
+    slides,
+    [
+        CodeSlide(
+            "CMake Module",
+            "cmake",
+            CMAKE_CODE,
+        ),
+        CodeSlide(
+            "C++ Usage",
+            "C++",
+            CPP_USAGE_CODE,
+        ),
+    ],
+)
 
 
 @slides.slide(debug_boxes=False)
-def gpl(slide):
+def builtin_validation(slide):
     content = logo_header_slide(slide, "Built-In Validation Functions")
-    lst = unordered_list(content)
-    lst.item().text("bounds (inclusive)")
-    lst.item().text("less than")
-    lst.item().text("greater than")
-    lst.item().text("less than or equal")
-    lst.item().text("greater than or equal")
-    lst.item(show="2").text("fixed string/array length")
-    lst.item(show="2").text("size of string/array length greater than")
-    lst.item(show="2").text("size of string/array length less than")
-    lst.item(show="2").text("array contains no duplicates")
-    lst.item(show="2").text("array is a subset of another array")
-    lst.item(show="2").text("bounds checking for elements of an array")
+    bullets(
+        content,
+        [
+            "bounds (inclusive)",
+            "less than",
+            "greater than",
+            "less than or equal",
+            "greater than or equal",
+            ("fixed string/array length", "2"),
+            ("size of string/array length greater than", "2"),
+            ("size of string/array length less than", "2"),
+            ("array contains no duplicates", "2"),
+            ("array is a subset of another array", "2"),
+            ("bounds checking for elements of an array", "2"),
+        ],
+    )
 
 
-@slides.slide(debug_boxes=False)
-def gpl(slide):
-    code_slide(
-        slide,
-        "Custom Validation",
-        "C++",
-        """
+CUSTOM_VALIDATION_CODE = """
 #include <rclcpp/rclcpp.hpp>
 #include <fmt/core.h>
 #include <tl_expected/expected.hpp>
@@ -369,75 +387,95 @@ tl::expected<void, std::string> multiple_of_23(
     }
   return {};
 }
-""",
+"""
+
+
+@slides.slide(debug_boxes=False)
+def custom_validation(slide):
+    code_slide(
+        slide,
+        "Custom Validation",
+        "C++",
+        CUSTOM_VALIDATION_CODE,
     )
 
 
 @slides.slide(debug_boxes=False)
-def gpl(slide):
+def other_features(slide):
     content = logo_header_slide(slide, "Other Killer Features")
-    lst = unordered_list(content.box())
-    lst.item().text("Dynamic parameters")
-    lst.item().text("Generation of RCLPY Parameter Libraries")
-    lst.item().text("Generation of Markdown Docs")
-    lst.item().text(
-        "Examples and docs at\n~link{github.com/PickNikRobotics/generate_parameter_library}"
+    bullets(
+        content.box(),
+        [
+            "Dynamic parameters",
+            "Generation of RCLPY Parameter Libraries",
+            "Generation of Markdown Docs",
+            "Examples and docs at\n~link{github.com/PickNikRobotics/generate_parameter_library}",
+            "Released on Humble, Iron, and Rolling",
+        ],
     )
-    lst.item().text("Released on Humble, Iron, and Rolling")
 
 
 @slides.slide(debug_boxes=False)
-def thank_you(slide):
+def contributors(slide):
     content = logo_header_slide(slide, "Contributions")
 
     content = content.fbox(horizontal=True, p_top=20, p_bottom=20)
-    lst = unordered_list(content.fbox())
-    lst.item().text("agonzat")
-    lst.item().text("bijoua29")
-    lst.item().text("Błażej Sowa")
-    lst.item().text("Bruno-Pier")
-    lst.item().text("Chance Cardona")
-    lst.item().text("Charles Cross")
-    lst.item().text("Chien shao-yu")
-    lst.item().text("Chris Thrasher")
-    lst.item().text("chriseichmann")
-    lst.item().text("Christoph Fröhlich")
-    lst.item().text("Denis Stogl")
-    lst = unordered_list(content.fbox())
-    lst.item().text("Diogo Almeida")
-    lst.item().text("Felix Exner (fexner)")
-    lst.item().text("Florian Vahl")
-    lst.item().text("g-argyropoulos")
-    lst.item().text("Griswald Brooks")
-    lst.item().text("Guelakais")
-    lst.item().text("GuiHome")
-    lst.item().text("Jan Gutsche")
-    lst.item().text("light-tech")
-    lst.item().text("Marq Rasmussen")
-    lst.item().text("Masaya Kataoka")
-    lst = unordered_list(content.fbox())
-    lst.item().text("Michael Carroll")
-    lst.item().text("Michael Wrock")
-    lst.item().text("mosfet80")
-    paul = lst.item().text("~#A{Paul Gesel}")
+    bullets(
+        content.fbox(),
+        [
+            "agonzat",
+            "bijoua29",
+            "Błażej Sowa",
+            "Bruno-Pier",
+            "Chance Cardona",
+            "Charles Cross",
+            "Chien shao-yu",
+            "Chris Thrasher",
+            "chriseichmann",
+            "Christoph Fröhlich",
+            "Denis Stogl",
+        ],
+    )
+    bullets(
+        content.fbox(),
+        [
+            "Diogo Almeida",
+            "Felix Exner (fexner)",
+            "Florian Vahl",
+            "g-argyropoulos",
+            "Griswald Brooks",
+            "Guelakais",
+            "GuiHome",
+            "Jan Gutsche",
+            "light-tech",
+            "Marq Rasmussen",
+            "Masaya Kataoka",
+        ],
+    )
+    names = bullets(
+        content.fbox(),
+        [
+            "Michael Carroll",
+            "Michael Wrock",
+            "mosfet80",
+            "~#A{Paul Gesel}",
+            "Sai Kishor Kothakota",
+            "Scott K Logan",
+            "Siddharth Saha",
+            "sprenger120",
+            "Steven! Ragnarök",
+            "Tony Najjar",
+            "Tyler Weaver",
+        ],
+    )
+    paul = names[3]
     paul.inline_box("#A", z_level=-1).rect(bg_color="orange")
-    lst.item().text("Sai Kishor Kothakota")
-    lst.item().text("Scott K Logan")
-    lst.item().text("Siddharth Saha")
-    lst.item().text("sprenger120")
-    lst.item().text("Steven! Ragnarök")
-    lst.item().text("Tony Najjar")
-    lst.item().text("Tyler Weaver")
 
 
 @slides.slide(debug_boxes=False)
 def users(slide):
     content = logo_header_slide(slide, "Users")
-    lst = unordered_list(content.box())
-    lst.item().text("MoveIt 2")
-    lst.item().text("ros2_control")
-    lst.item().text("PickNik Clients")
-    lst.item().text("you?")
+    bullets(content.box(), ["MoveIt 2", "ros2_control", "PickNik Clients", "you?"])
 
 
 @slides.slide(debug_boxes=False)
@@ -446,33 +484,37 @@ def part3(slide):
 
 
 @slides.slide(debug_boxes=False)
-def gpl(slide):
+def why_so_many(slide):
     content = logo_header_slide(slide, "Why so many parameters?")
-    lst = unordered_list(content.box())
-    lst.item().text("Users use defaults for most parameters")
-    lst.item(show="2+").text("Authors only test default values")
-    lst.item(show="3+").text("Permutations of parameters grow exponentially")
-    lst.item(show="4+").text(
-        "The more complex your interface the less useful your abstraction"
+    bullets(
+        content.box(),
+        [
+            "Users use defaults for most parameters",
+            ("Authors only test default values", "2+"),
+            ("Permutations of parameters grow exponentially", "3+"),
+            ("The more complex your interface the less useful your abstraction", "4+"),
+            ("Resist the urge to expose interior details as parameters", "5+"),
+        ],
     )
-    lst.item(show="5+").text("Resist the urge to expose interior details as parameters")
 
 
 @slides.slide(debug_boxes=False)
-def gpl(slide):
+def good_parameter(slide):
     content = logo_header_slide(slide, "What is a good parameter?")
-    lst = unordered_list(content.box())
-    lst.item().text("Express user intent (latency or throughput)")
-    lst.item(show="2+").text("Details like buffer sizes scale with hardware")
-    lst.item(show="3+").text(
-        "Leave the door open to improvements in behavior for the user"
+    bullets(
+        content.box(),
+        [
+            "Express user intent (latency or throughput)",
+            ("Details like buffer sizes scale with hardware", "2+"),
+            ("Leave the door open to improvements in behavior for the user", "3+"),
+        ],
     )
 
 
 @slides.slide(debug_boxes=False)
 def thank_you(slide):
     content = logo_header_slide(slide, "Questions?")
-    content.fbox().image("images/parameters_link_qr.svg")
+    content.fbox().image(get_slides_image_path("parameters_link_qr.svg"))
     content.sbox(p_bottom=20).text(
         "Slides rendered using Elsie\n~link{tylerjw.dev/posts/roscon23-parameters/}",
         elsie.TextStyle(align="middle", size=32),
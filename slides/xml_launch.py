@@ -2,7 +2,16 @@
 
 import elsie
 from elsie.ext import unordered_list
-from my_layouts import *
+from my_layouts import (
+    KART_IMG,
+    bullets,
+    code_slide,
+    get_slides_image_path,
+    image_slide,
+    init_deck,
+    logo_header_slide,
+    render_deck,
+)
 
 
 slides = init_deck()
@@ -18,18 +27,23 @@ def title(slide):
         "Remember XML files?", elsie.TextStyle(size=36, bold=True, italic=True)
     )
     content.box(width="fill", p_top=10).text("October 19, 2023")
-    content.box(width="fill", p_top=180).text("Tyler Weaver")
-    content.box(width="fill").text("Staff Software Engineer\ntyler@picknik.ai")
+    content.box(width="fill", p_top=180).text(
+        "Tyler Weaver\nStaff Software Engineer\ntyler@picknik.ai"
+    )
 
 
 @slides.slide(debug_boxes=False)
 def author(slide):
-    text_area = image_slide(slide, "Tyler Weaver", get_image_path("kart.jpg"))
-    lst = unordered_list(text_area)
-    lst.item().text("Racing Kart Driver")
-    lst.item().text("MoveIt Maintainer")
-    lst.item().text("Rust Evangelist")
-    lst.item().text("Docker Skeptic")
+    text_area = image_slide(slide, "Tyler Weaver", KART_IMG)
+    bullets(
+        text_area,
+        [
+            "Racing Kart Driver",
+            "MoveIt Maintainer",
+            "Rust Evangelist",
+            "Docker Skeptic",
+        ],
+    )
 
 
 @slides.slide(debug_boxes=False)
@@ -215,7 +229,9 @@ def initial_success(slide):
 </launch>
   """,
     )
-    slide.overlay(show="2+").image("images/xml_launch_rviz.png", scale=1.4)
+    slide.overlay(show="2+").image(
+        get_slides_image_path("xml_launch_rviz.png"), scale=1.4
+    )
 
 
 @slides.slide(debug_boxes=False)
@@ -230,7 +246,7 @@ def better_place(slide):
     )
     lst.item().text("Single ~link{moveit.yaml} config for MoveIt")
     lst.item().text("Try it yourself: ~link{tylerjw.dev/posts/xml-launch}")
-    content.fbox().image("images/xml_launch_link_qr.svg")
+    content.fbox().image(get_slides_image_path("xml_launch_link_qr.svg"))
 
 
 render_deck(slides, "xml_launch.pdf")